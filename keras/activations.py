@@ -81,9 +81,7 @@ def softmax(x, axis=-1):
             output = tf.nn.softmax(x, axis=axis)
         else:
             # nn.softmax does not support tuple axis.
-            e = tf.exp(x - tf.reduce_max(x, axis=axis, keepdims=True))
-            s = tf.reduce_sum(e, axis=axis, keepdims=True)
-            output = e / s
+            output = _softmax_over_axes(x, axis)
     else:
         raise ValueError(
             "Cannot apply softmax to a tensor that is 1D. "
@@ -95,6 +93,54 @@ def softmax(x, axis=-1):
     return output
 
 
+def _softmax_over_axes(x, axis):
+    """Applies softmax jointly over several axes of `x`.
+
+    The reduced axes are moved to the end and collapsed into a single axis so
+    that the whole computation runs through the fused `tf.nn.softmax` kernel
+    instead of separate max / exp / sum / divide ops.
+
+    Args:
+      x: Input tensor of known rank.
+      axis: Tuple or list of integers, the axes to normalize over.
+
+    Returns:
+      Tensor of the same shape as `x`.
+
+    Raises:
+      ValueError: If an entry of `axis` is out of range for the rank of `x`.
+    """
+    rank = x.shape.rank
+    for a in axis:
+        if not -rank <= a < rank:
+            raise ValueError(
+                f"Invalid axis {a} for softmax over a tensor of rank {rank}. "
+                f"Received: axis={axis}"
+            )
+    reduced = sorted({a % rank for a in axis})
+    kept = [i for i in range(rank) if i not in reduced]
+    perm = kept + reduced
+    transposed = tf.transpose(x, perm) if perm != list(range(rank)) else x
+    transposed_shape = tf.shape(transposed)
+    # The collapsed size is computed explicitly: a `-1` cannot be inferred
+    # when another dimension (e.g. an empty batch) is 0.
+    flat = tf.reshape(
+        transposed,
+        tf.concat(
+            [
+                transposed_shape[: len(kept)],
+                [tf.reduce_prod(transposed_shape[len(kept) :])],
+            ],
+            axis=0,
+        ),
+    )
+    output = tf.reshape(tf.nn.softmax(flat, axis=-1), transposed_shape)
+    if perm != list(range(rank)):
+        inverse_perm = [perm.index(i) for i in range(rank)]
+        output = tf.transpose(output, inverse_perm)
+    return output
+
+
 @keras_export("keras.activations.elu")
 @tf.__internal__.dispatch.add_dispatch_support
 def elu(x, alpha=1.0):
@@ -311,6 +357,9 @@ def relu(x, alpha=0.0, max_value=None, threshold=0.0):
         transformed by the relu activation function.
         Tensor will be of the same shape and dtype of input `x`.
     """
+    if alpha == 0.0 and max_value is None and threshold == 0.0:
+        # Default arguments: dispatch straight to the native op.
+        return tf.nn.relu(x)
     return backend.relu(
         x, alpha=alpha, max_value=max_value, threshold=threshold
     )
@@ -482,6 +531,31 @@ def linear(x):
     return x
 
 
+# Serialized names of the activation functions defined in this module, so that
+# `serialize` can skip the generic object serialization for them.
+_BUILTIN_ACTIVATION_NAMES = {
+    fn: fn.__name__
+    for fn in (
+        softmax,
+        elu,
+        selu,
+        softplus,
+        softsign,
+        swish,
+        relu,
+        gelu,
+        tanh,
+        sigmoid,
+        exponential,
+        hard_sigmoid,
+        linear,
+    )
+}
+# `tf.nn.softmax` is matched by identity here; `_TF_ACTIVATIONS_V2` is only
+# consulted for other callables that carry a v2 activation name.
+_BUILTIN_ACTIVATION_NAMES[tf.nn.softmax] = "softmax"
+
+
 @keras_export("keras.activations.serialize")
 @tf.__internal__.dispatch.add_dispatch_support
 def serialize(activation):
@@ -507,6 +581,10 @@ def serialize(activation):
     Raises:
         ValueError: The input function is not a valid one.
     """
+    try:
+        return _BUILTIN_ACTIVATION_NAMES[activation]
+    except (KeyError, TypeError):
+        pass
     if (
         hasattr(activation, "__name__")
         and activation.__name__ in _TF_ACTIVATIONS_V2
@@ -523,6 +601,28 @@ relu6 = tf.nn.relu6
 silu = tf.nn.silu
 
 
+# Lookup table of every activation function and layer `deserialize` can
+# resolve by name. Built on first use, once this module is fully defined.
+_ACTIVATION_FUNCTIONS = None
+
+
+def _get_activation_functions():
+    global _ACTIVATION_FUNCTIONS
+    if _ACTIVATION_FUNCTIONS is None:
+        activation_functions = {}
+        current_module = sys.modules[__name__]
+
+        # we put 'current_module' after 'activation_layers' to prefer the local
+        # one if there is a collision
+        generic_utils.populate_dict_with_module_objects(
+            activation_functions,
+            (activation_layers, current_module),
+            obj_filter=callable,
+        )
+        _ACTIVATION_FUNCTIONS = activation_functions
+    return _ACTIVATION_FUNCTIONS
+
+
 @keras_export("keras.activations.deserialize")
 @tf.__internal__.dispatch.add_dispatch_support
 def deserialize(name, custom_objects=None):
@@ -551,20 +651,9 @@ def deserialize(name, custom_objects=None):
         ValueError: `Unknown activation function` if the input string does not
         denote any defined Tensorflow activation function.
     """
-    activation_functions = {}
-    current_module = sys.modules[__name__]
-
-    # we put 'current_module' after 'activation_layers' to prefer the local one
-    # if there is a collision
-    generic_utils.populate_dict_with_module_objects(
-        activation_functions,
-        (activation_layers, current_module),
-        obj_filter=callable,
-    )
-
     return generic_utils.deserialize_keras_object(
         name,
-        module_objects=activation_functions,
+        module_objects=_get_activation_functions(),
         custom_objects=custom_objects,
         printable_module_name="activation function",
     )
@@ -602,6 +691,15 @@ def get(identifier):
     """
     if identifier is None:
         return linear
+    if (
+        isinstance(identifier, str)
+        and identifier not in generic_utils.get_custom_objects()
+    ):
+        # Fast path for built-in activation functions. Layer classes still go
+        # through `deserialize` so that they get instantiated.
+        fn = _get_activation_functions().get(identifier)
+        if fn is not None and not isinstance(fn, type):
+            return fn
     if isinstance(identifier, (str, dict)):
         return deserialize(identifier)
     elif callable(identifier):
@@ -25,6 +25,7 @@ from keras.testing_infra import test_combinations
 import keras.layers.activation as activation_layers
 from keras.layers import core
 from keras.layers import serialization
+from keras.utils import generic_utils
 
 
 def _ref_softmax(values):
@@ -66,6 +67,20 @@ class KerasActivationsTest(tf.test.TestCase, parameterized.TestCase):
             fn = activations.deserialize(config)
             assert fn.__name__ == activation_map[fn_v2_key]
 
+    def test_get_respects_custom_object_scope(self):
+        def custom_relu(x):
+            return x
+
+        self.assertIs(activations.get("relu"), activations.relu)
+        with generic_utils.custom_object_scope({"relu": custom_relu}):
+            self.assertIs(activations.get("relu"), custom_relu)
+        self.assertIs(activations.get("relu"), activations.relu)
+
+    def test_get_instantiates_layer_classes(self):
+        self.assertIsInstance(
+            activations.get("LeakyReLU"), activation_layers.LeakyReLU
+        )
+
     def test_serialization_with_layers(self):
         activation = activation_layers.LeakyReLU(alpha=0.1)
         layer = core.Dense(3, activation=activation)
@@ -124,6 +139,29 @@ class KerasActivationsTest(tf.test.TestCase, parameterized.TestCase):
             expected[i, :, :] = _ref_softmax(test_values[i, :, :])
         self.assertAllClose(result, expected, rtol=1e-05)
 
+    def test_softmax_4d_axis_tuple_non_contiguous(self):
+        x = backend.placeholder(ndim=4)
+        f = backend.function([x], [activations.softmax(x, axis=(1, -1))])
+        test_values = np.random.random((2, 3, 4, 5))
+        result = f([test_values])[0]
+        expected = np.zeros((2, 3, 4, 5))
+        for i in range(2):
+            for j in range(4):
+                expected[i, :, j, :] = _ref_softmax(test_values[i, :, j, :])
+        self.assertAllClose(result, expected, rtol=1e-05)
+
+    def test_softmax_3d_axis_tuple_empty_batch(self):
+        result = self.evaluate(
+            activations.softmax(tf.zeros((0, 3, 4)), axis=(1, 2))
+        )
+        self.assertEqual(result.shape, (0, 3, 4))
+
+    def test_softmax_axis_tuple_out_of_range(self):
+        x = backend.placeholder(ndim=3)
+        for axis in [(1, 3), (1, 5), (1, -4)]:
+            with self.assertRaisesRegex(ValueError, "Invalid axis"):
+                activations.softmax(x, axis=axis)
+
     def test_temporal_softmax(self):
         x = backend.placeholder(shape=(2, 2, 3))
         f = backend.function([x], [activations.softmax(x)])
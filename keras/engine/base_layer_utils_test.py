@@ -70,22 +70,20 @@ class OpLayerTest(test_combinations.TestCase):
         int_values = keras.Input(shape=(2,), dtype=tf.int32)
         float_values = tf.cast(int_values, tf.float32)
         model = keras.Model(int_values, float_values)
-        model.compile(loss="mse")
 
         input_data = np.array([[1, 2], [3, 4]], dtype=np.int32)
         expected = [[1.0, 2.0], [3.0, 4.0]]
-        output = model.predict(input_data)
+        output = model(input_data, training=False)
         self.assertAllClose(expected, output)
 
     def test_ragged_op_layer_keras_tensors(self):
         int_values = keras.Input(shape=(None,), dtype=tf.int32, ragged=True)
         float_values = tf.cast(int_values, tf.float32)
         model = keras.Model(int_values, float_values)
-        model.compile(loss="mse")
 
         input_data = tf.ragged.constant([[1, 2], [3, 4]], dtype=np.int32)
         expected = [[1.0, 2.0], [3.0, 4.0]]
-        output = model.predict(input_data)
+        output = model(input_data, training=False)
         self.assertIsInstance(output, tf.RaggedTensor)
         self.assertAllClose(expected, output)
 
@@ -94,13 +92,14 @@ class OpLayerTest(test_combinations.TestCase):
         float_values = tf.cast(int_values, tf.float32)
         _ = keras.Model(int_values, float_values)
         model = keras.Model(int_values, float_values)
-        model.compile(loss="mse")
 
-        input_data = tf.sparse.from_dense(
-            np.array([[1, 2], [3, 4]], dtype=np.int32)
+        input_data = tf.SparseTensor(
+            indices=[[0, 0], [0, 1], [1, 0], [1, 1]],
+            values=np.array([1, 2, 3, 4], dtype=np.int32),
+            dense_shape=[2, 2],
         )
         expected = [[1.0, 2.0], [3.0, 4.0]]
-        output = model.predict(input_data)
+        output = model(input_data, training=False)
         self.assertIsInstance(output, tf.SparseTensor)
         self.assertAllClose(expected, tf.sparse.to_dense(output))
 
@@ -34,11 +34,16 @@ from keras.layers import core
 from keras.utils import io_utils
 
 
-def _create_dataset(num_samples, batch_size):
-    input_data = np.random.rand(num_samples, 1)
+# Shared random inputs; tests slice views out of it instead of drawing new
+# arrays on every run.
+_RANDOM_POOL = np.random.default_rng(0).random((1000, 10), dtype=np.float32)
+
+
+def _create_dataset(num_samples, batch_size, offset=0):
+    input_data = _RANDOM_POOL[offset : offset + num_samples, :1]
     expected_data = input_data * 3
     dataset = tf.data.Dataset.from_tensor_slices((input_data, expected_data))
-    return dataset.shuffle(10 * batch_size).batch(batch_size)
+    return dataset.batch(batch_size).cache()
 
 
 @test_combinations.run_with_all_model_types
@@ -69,7 +74,9 @@ class ValidationDatasetAndValidationSplit(
         )
 
         train_dataset = _create_dataset(num_samples=200, batch_size=10)
-        eval_dataset = _create_dataset(num_samples=50, batch_size=25)
+        eval_dataset = _create_dataset(
+            num_samples=50, batch_size=25, offset=200
+        )
 
         # Make sure model.fit doesn't raise an error because of the mocking alone.
         mock_train_validation_split_return = (
@@ -86,7 +93,7 @@ class ValidationDatasetAndValidationSplit(
                 x=train_dataset,
                 validation_split=validation_split,
                 validation_data=eval_dataset,
-                epochs=2,
+                epochs=1,
             )
             mock_train_validation_split.assert_not_called()
 
@@ -115,7 +122,9 @@ class ValidationDatasetNoLimitTest(test_combinations.TestCase):
         )
 
         train_dataset = _create_dataset(num_samples=200, batch_size=10)
-        eval_dataset = _create_dataset(num_samples=50, batch_size=25)
+        eval_dataset = _create_dataset(
+            num_samples=50, batch_size=25, offset=200
+        )
 
         history = model.fit(
             x=train_dataset, validation_data=eval_dataset, epochs=2
@@ -217,23 +226,20 @@ class PrintTrainingInfoTest(test_combinations.TestCase, parameterized.TestCase):
 
         model.fit(
             x={
-                "one": np.random.rand(100, 10, 1),
-                "two": np.random.rand(100, 10, 1),
+                "one": _RANDOM_POOL[:100, :, np.newaxis].astype(np.float64),
+                "two": _RANDOM_POOL[100:200, :, np.newaxis].astype(np.float64),
             },
-            y=np.random.rand(100, 10, 1),
+            y=_RANDOM_POOL[200:300, :, np.newaxis].astype(np.float64),
         )
 
     def test_dict_validation_input(self):
         """Test case for GitHub issue 30122."""
-        train_input_0 = np.random.rand(1000, 1)
-        train_input_1 = np.random.rand(1000, 1)
-        train_labels = np.random.rand(1000, 1)
-        val_input_0 = np.random.rand(1000, 1)
-        val_input_1 = np.random.rand(1000, 1)
-        val_labels = np.random.rand(1000, 1)
-
-        input_0 = keras.Input(shape=(None,), name="input_0")
-        input_1 = keras.Input(shape=(None,), name="input_1")
+        train_input_0 = _RANDOM_POOL[:, 0:1]
+        train_input_1 = _RANDOM_POOL[:, 1:2]
+        train_labels = _RANDOM_POOL[:, 2:3]
+        val_input_0 = _RANDOM_POOL[:, 3:4]
+        val_input_1 = _RANDOM_POOL[:, 4:5]
+        val_labels = _RANDOM_POOL[:, 5:6]
 
         class my_model(keras.Model):
             def __init__(self):
@@ -243,7 +249,7 @@ class PrintTrainingInfoTest(test_combinations.TestCase, parameterized.TestCase):
                 self.concat = keras.layers.Concatenate()
                 self.out_layer = keras.layers.Dense(1, activation="sigmoid")
 
-            def call(self, inputs=[input_0, input_1]):
+            def call(self, inputs):
                 activation_0 = self.hidden_layer_0(inputs["input_0"])
                 activation_1 = self.hidden_layer_1(inputs["input_1"])
                 concat = self.concat([activation_0, activation_1])
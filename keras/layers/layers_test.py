@@ -21,9 +21,9 @@ import tensorflow.compat.v2 as tf
 
 class LayersTest(tf.test.TestCase):
     def test_keras_private_symbol(self):
-        normalization_parent = layers.BatchNormalization.__module__.split(".")[
-            -1
-        ]
+        normalization_parent = layers.BatchNormalization.__module__.rpartition(
+            "."
+        )[2]
         if tf.__internal__.tf2.enabled():
             self.assertEqual("batch_normalization", normalization_parent)
             self.assertTrue(layers.BatchNormalization._USE_V2_BEHAVIOR)
@@ -18,7 +18,7 @@ import tensorflow.compat.v2 as tf
 
 # pylint: disable=g-classes-have-attributes
 
-import time
+import itertools
 import numpy as np
 from keras.testing_infra import test_combinations
 from keras.engine import base_preprocessing_layer
@@ -31,6 +31,10 @@ class PreprocessingStageTest(
     test_combinations.TestCase, preprocessing_test_utils.PreprocessingLayerTest
 ):
     def test_adapt(self):
+        # Sequence numbers rather than timestamps, so that consecutive `adapt`
+        # calls are always strictly ordered.
+        adapt_order = itertools.count()
+
         class PL(base_preprocessing_layer.PreprocessingLayer):
             def __init__(self, **kwargs):
                 self.adapt_time = None
@@ -38,7 +42,7 @@ class PreprocessingStageTest(
                 super().__init__(**kwargs)
 
             def adapt(self, data, reset_state=True):
-                self.adapt_time = time.time()
+                self.adapt_time = next(adapt_order)
                 self.adapt_count += 1
 
             def call(self, inputs):
@@ -22,9 +22,20 @@ from absl.testing import parameterized
 import numpy as np
 
 import keras
+from keras.mixed_precision import policy
 from keras.testing_infra import test_combinations
 from keras.testing_infra import test_utils
 
+# Read-only inputs shared by the tests below; they are marked non-writeable so
+# an in-place update fails instead of leaking into other tests.
+_RNG = np.random.default_rng(0)
+_RANDOM_INPUTS = _RNG.random((2, 3, 4), dtype=np.float32)
+_RANDOM_TARGETS = _RNG.random((2, 2), dtype=np.float32)
+_ONES_INPUTS = np.ones((2, 3), dtype=np.float32)
+_RANDOM_INPUTS.setflags(write=False)
+_RANDOM_TARGETS.setflags(write=False)
+_ONES_INPUTS.setflags(write=False)
+
 
 @test_combinations.generate(test_combinations.keras_mode_combinations())
 class SimpleRNNLayerTest(tf.test.TestCase, parameterized.TestCase):
@@ -56,18 +67,26 @@ class SimpleRNNLayerTest(tf.test.TestCase, parameterized.TestCase):
             input_dtype="float64",
         )
 
+    @test_utils.enable_v2_dtype_behavior
+    def test_mixed_bfloat16_SimpleRNN(self):
+        try:
+            policy.set_global_policy("mixed_bfloat16")
+            layer = keras.layers.SimpleRNN(2, return_sequences=True)
+            self.assertEqual(layer._dtype_policy.name, "mixed_bfloat16")
+            outputs = layer(_RANDOM_INPUTS)
+            self.assertEqual(outputs.dtype, "bfloat16")
+            self.assertEqual(outputs.shape, (2, 3, 2))
+            self.assertEqual(layer.cell.kernel.dtype, "float32")
+        finally:
+            policy.set_global_policy("float32")
+
     def test_dynamic_behavior_SimpleRNN(self):
-        num_samples = 2
-        timesteps = 3
         embedding_dim = 4
         units = 2
         layer = keras.layers.SimpleRNN(units, input_shape=(None, embedding_dim))
-        model = keras.models.Sequential()
-        model.add(layer)
+        model = keras.models.Sequential([layer])
         model.compile("rmsprop", "mse")
-        x = np.random.random((num_samples, timesteps, embedding_dim))
-        y = np.random.random((num_samples, units))
-        model.train_on_batch(x, y)
+        model.train_on_batch(_RANDOM_INPUTS, _RANDOM_TARGETS)
 
     def test_dropout_SimpleRNN(self):
         num_samples = 2
@@ -80,17 +99,17 @@ class SimpleRNNLayerTest(tf.test.TestCase, parameterized.TestCase):
             input_shape=(num_samples, timesteps, embedding_dim),
         )
 
-    def test_implementation_mode_SimpleRNN(self):
+    @parameterized.parameters([0, 1, 2])
+    def test_implementation_mode_SimpleRNN(self, implementation_mode):
         num_samples = 2
         timesteps = 3
         embedding_dim = 4
         units = 2
-        for mode in [0, 1, 2]:
-            test_utils.layer_test(
-                keras.layers.SimpleRNN,
-                kwargs={"units": units, "implementation": mode},
-                input_shape=(num_samples, timesteps, embedding_dim),
-            )
+        test_utils.layer_test(
+            keras.layers.SimpleRNN,
+            kwargs={"units": units, "implementation": implementation_mode},
+            input_shape=(num_samples, timesteps, embedding_dim),
+        )
 
     def test_constraints_SimpleRNN(self):
         embedding_dim = 4
@@ -114,14 +133,20 @@ class SimpleRNNLayerTest(tf.test.TestCase, parameterized.TestCase):
 
     def test_with_masking_layer_SimpleRNN(self):
         layer_class = keras.layers.SimpleRNN
-        inputs = np.random.random((2, 3, 4))
         targets = np.abs(np.random.random((2, 3, 5)))
         targets /= targets.sum(axis=-1, keepdims=True)
-        model = keras.models.Sequential()
-        model.add(keras.layers.Masking(input_shape=(3, 4)))
-        model.add(layer_class(units=5, return_sequences=True, unroll=False))
-        model.compile(loss="categorical_crossentropy", optimizer="rmsprop")
-        model.fit(inputs, targets, epochs=1, batch_size=2, verbose=1)
+        model = keras.models.Sequential(
+            [
+                keras.layers.Masking(input_shape=(3, 4)),
+                layer_class(units=5, return_sequences=True, unroll=False),
+            ]
+        )
+        model.compile(
+            loss="categorical_crossentropy",
+            optimizer="rmsprop",
+            run_eagerly=test_utils.should_run_eagerly(),
+        )
+        model.train_on_batch(_RANDOM_INPUTS, targets)
 
     def test_from_config_SimpleRNN(self):
         layer_class = keras.layers.SimpleRNN
@@ -152,7 +177,7 @@ class SimpleRNNLayerTest(tf.test.TestCase, parameterized.TestCase):
         layer.build((None, None, 2))
         self.assertLen(layer.losses, 3)
 
-        x = keras.backend.variable(np.ones((2, 3, 2)))
+        x = tf.ones((2, 3, 2))
         layer(x)
         if tf.executing_eagerly():
             self.assertLen(layer.losses, 4)
@@ -165,65 +190,60 @@ class SimpleRNNLayerTest(tf.test.TestCase, parameterized.TestCase):
         embedding_dim = 4
         units = 2
         layer_class = keras.layers.SimpleRNN
-        model = keras.models.Sequential()
-        model.add(
-            keras.layers.Embedding(
-                4,
-                embedding_dim,
-                mask_zero=True,
-                input_length=timesteps,
-                batch_input_shape=(num_samples, timesteps),
-            )
-        )
         layer = layer_class(
             units, return_sequences=False, stateful=True, weights=None
         )
-        model.add(layer)
+        model = keras.models.Sequential(
+            [
+                keras.layers.Embedding(
+                    4,
+                    embedding_dim,
+                    mask_zero=True,
+                    input_length=timesteps,
+                    batch_input_shape=(num_samples, timesteps),
+                ),
+                layer,
+            ]
+        )
         model.compile(
-            optimizer=tf.compat.v1.train.GradientDescentOptimizer(0.01),
+            optimizer=keras.optimizers.SGD(0.01),
             loss="mse",
             run_eagerly=test_utils.should_run_eagerly(),
         )
-        out1 = model.predict(np.ones((num_samples, timesteps)))
+        out1 = model.predict(_ONES_INPUTS)
         self.assertEqual(out1.shape, (num_samples, units))
 
         # train once so that the states change
-        model.train_on_batch(
-            np.ones((num_samples, timesteps)), np.ones((num_samples, units))
-        )
-        out2 = model.predict(np.ones((num_samples, timesteps)))
+        model.train_on_batch(_ONES_INPUTS, np.ones((num_samples, units)))
+        out2 = model.predict(_ONES_INPUTS)
 
         # if the state is not reset, output should be different
-        self.assertNotEqual(out1.max(), out2.max())
+        self.assertTrue(np.any(out1 != out2))
 
         # check that output changes after states are reset
         # (even though the model itself didn't change)
         layer.reset_states()
-        out3 = model.predict(np.ones((num_samples, timesteps)))
-        self.assertNotEqual(out2.max(), out3.max())
+        out3 = model.predict(_ONES_INPUTS)
+        self.assertTrue(np.any(out2 != out3))
 
         # check that container-level reset_states() works
         model.reset_states()
-        out4 = model.predict(np.ones((num_samples, timesteps)))
+        out4 = model.predict(_ONES_INPUTS)
         np.testing.assert_allclose(out3, out4, atol=1e-5)
 
         # check that the call to `predict` updated the states
-        out5 = model.predict(np.ones((num_samples, timesteps)))
-        self.assertNotEqual(out4.max(), out5.max())
+        out5 = model.predict(_ONES_INPUTS)
+        self.assertTrue(np.any(out4 != out5))
 
         # Check masking
         layer.reset_states()
 
-        left_padded_input = np.ones((num_samples, timesteps))
-        left_padded_input[0, :1] = 0
-        left_padded_input[1, :2] = 0
+        left_padded_input = np.array([[0, 1, 1], [0, 0, 1]], dtype=np.float32)
         out6 = model.predict(left_padded_input)
 
         layer.reset_states()
 
-        right_padded_input = np.ones((num_samples, timesteps))
-        right_padded_input[0, -1:] = 0
-        right_padded_input[1, -2:] = 0
+        right_padded_input = np.array([[1, 1, 0], [1, 0, 0]], dtype=np.float32)
         out7 = model.predict(right_padded_input)
 
         np.testing.assert_allclose(out7, out6, atol=1e-5)
@@ -152,10 +152,10 @@ def _int32_manipulation_at_max_shape_dims_limit():
     assert x.shape.as_list() == [keras_tensor._MAX_TENSOR_RANK]
 
     # Verify that a value was actually inferred for a tensor that *might*
-    # represent the shape, bying checking that a value in
-    # the range appears in the printed inferred value
+    # represent the shape, by checking that a value in
+    # the range appears in the inferred value
     if tf.compat.v1.executing_eagerly_outside_functions():
-        assert str(keras_tensor._MAX_TENSOR_RANK - 1) in str(x)
+        assert keras_tensor._MAX_TENSOR_RANK - 1 in x._inferred_value
 
     x = tf.reshape(x, (batch_size, num_features))
     x = tf.cast(x, dtype="float32")
@@ -322,7 +322,7 @@ class AutoLambdaTest(test_combinations.TestCase):
             lambda x: np.ones((2,) + tuple(x.shape[1:]), "float32"),
             model.outputs,
         )
-        model.fit(np_inputs, np_outputs, batch_size=2)
+        model.train_on_batch(np_inputs, np_outputs)
         model(np_inputs)  # Test calling the model directly on inputs.
 
         new_model = keras.Model.from_config(
@@ -332,7 +332,7 @@ class AutoLambdaTest(test_combinations.TestCase):
         new_model.compile(
             adam.Adam(0.001), "mse", run_eagerly=test_utils.should_run_eagerly()
         )
-        new_model.fit(np_inputs, np_outputs, batch_size=2)
+        new_model.train_on_batch(np_inputs, np_outputs)
         new_model(np_inputs)  # Test calling the new model directly on inputs.
         # Assert that metrics are preserved and in the right order.
         self.assertAllEqual(model.metrics_names, new_model.metrics_names)
@@ -342,50 +342,29 @@ class AutoLambdaTest(test_combinations.TestCase):
             [layer.name for layer in new_model.layers],
         )
 
-    def test_stack_preserves_correct_shape(self):
-        ## Test stack([x])
+    def _check_stack_round_trip(self, stack_fn, expected_shape):
         inp = keras.Input(shape=(), dtype="float32")
-
-        out = tf.stack([inp])
-        model = keras.Model(inputs=inp, outputs=out)
-        model.compile(
-            adam.Adam(0.001), "mse", run_eagerly=test_utils.should_run_eagerly()
-        )
+        model = keras.Model(inputs=inp, outputs=stack_fn(inp))
 
         x = tf.ones(shape=(4, 4))
-        expected = tf.stack([x])
-        self.assertAllEqual(expected.shape, (1, 4, 4))
+        expected = stack_fn(x)
+        self.assertAllEqual(expected.shape, expected_shape)
 
-        self.assertAllEqual(model(x).shape, (1, 4, 4))
+        self.assertAllEqual(model(x).shape, expected_shape)
         self.assertAllEqual(model(x), expected)
 
         config = model.get_config()
         model = keras.Model.from_config(config)
 
-        self.assertAllEqual(model(x).shape, (1, 4, 4))
+        self.assertAllEqual(model(x).shape, expected_shape)
         self.assertAllEqual(model(x), expected)
 
-        ## Test stack(x)
-        inp = keras.Input(shape=(), dtype="float32")
-
-        out = tf.stack(inp)
-        model = keras.Model(inputs=inp, outputs=out)
-        model.compile(
-            adam.Adam(0.001), "mse", run_eagerly=test_utils.should_run_eagerly()
-        )
-
-        x = tf.ones(shape=(4, 4))
-        expected = tf.stack(x)
-        self.assertAllEqual(expected.shape, (4, 4))
-
-        self.assertAllEqual(model(x).shape, (4, 4))
-        self.assertAllEqual(model(x), expected)
-
-        config = model.get_config()
-        model = keras.Model.from_config(config)
+    def test_stack_preserves_correct_shape(self):
+        ## Test stack([x])
+        self._check_stack_round_trip(lambda t: tf.stack([t]), (1, 4, 4))
 
-        self.assertAllEqual(model(x).shape, (4, 4))
-        self.assertAllEqual(model(x), expected)
+        ## Test stack(x)
+        self._check_stack_round_trip(tf.stack, (4, 4))
 
     def test_getitem_slice_with_step_only(self):
         if not tf.executing_eagerly():
@@ -400,9 +379,9 @@ class AutoLambdaTest(test_combinations.TestCase):
         )
         batch_size = 7
         step = 3
-        x = tf.stack([tf.range(8) for _ in range(batch_size)])
+        x = tf.broadcast_to(tf.range(8), (batch_size, 8))
         args = [x, tf.constant(step, shape=(batch_size,))]
-        expected = tf.stack([tf.range(8)[::step] for _ in range(batch_size)])
+        expected = np.tile(np.arange(8)[::step], (batch_size, 1))
 
         if tf.compat.v1.executing_eagerly_outside_functions():
             self.assertIn(
@@ -509,7 +488,7 @@ class AutoLambdaTest(test_combinations.TestCase):
         )
         batch_size = 7
         stop = 6
-        x = tf.stack([tf.range(8) for _ in range(batch_size)])
+        x = tf.broadcast_to(tf.range(8), (batch_size, 8))
         args = [x, tf.constant(stop, shape=(batch_size,))]
         expected = x[:stop]
 
@@ -545,9 +524,9 @@ class AutoLambdaTest(test_combinations.TestCase):
         )
         batch_size = 7
         stop = 6
-        x = tf.stack([tf.range(8) for _ in range(batch_size)])
+        x = tf.broadcast_to(tf.range(8), (batch_size, 8))
         args = [x, tf.constant(stop, shape=(batch_size,))]
-        expected = tf.stack([tf.range(8)[:stop] for _ in range(batch_size)])
+        expected = np.tile(np.arange(8)[:stop], (batch_size, 1))
 
         if tf.compat.v1.executing_eagerly_outside_functions():
             self.assertIn(
@@ -591,17 +570,7 @@ class AutoLambdaTest(test_combinations.TestCase):
         start = 1
         stop = 6
         step = 2
-        x = tf.stack(
-            [
-                tf.stack(
-                    [
-                        tf.stack([tf.range(8) for _ in range(3)])
-                        for _ in range(4)
-                    ]
-                )
-                for _ in range(batch_size)
-            ]
-        )
+        x = tf.broadcast_to(tf.range(8), (batch_size, 4, 3, 8))
         args = [
             x,
             tf.constant(0, shape=(batch_size,)),
@@ -611,12 +580,7 @@ class AutoLambdaTest(test_combinations.TestCase):
         ]
         # Slice the innermost dim. only grab one index from the second-to-innermost
         # dim, removing that dim from the shape.
-        expected = tf.stack(
-            [
-                tf.stack([tf.range(8)[start:stop:step] for _ in range(4)])
-                for _ in range(batch_size)
-            ]
-        )
+        expected = np.tile(np.arange(8)[start:stop:step], (batch_size, 4, 1))
 
         if tf.compat.v1.executing_eagerly_outside_functions():
             self.assertIn(
@@ -86,7 +86,7 @@ class ModelSubclassingTest(test_combinations.TestCase):
 
         model = DummyModel()
         model.compile("sgd", "mse", run_eagerly=test_utils.should_run_eagerly())
-        model.fit(np.ones((10, 10)), np.ones((10, 1)), batch_size=2, epochs=2)
+        model.fit(np.ones((10, 10)), np.ones((10, 1)), batch_size=2, epochs=1)
         self.assertLen(model.layers, 2)
         self.assertLen(model.trainable_variables, 4)
 
@@ -141,9 +141,7 @@ class ModelSubclassingTest(test_combinations.TestCase):
                     "embedding_kernel",
                     shape=[self.vocab_size, self.embedding_dim],
                     dtype=np.float32,
-                    initializer=tf.compat.v1.random_uniform_initializer(
-                        -0.1, 0.1
-                    ),
+                    initializer="zeros",
                     trainable=True,
                 )
 
@@ -202,37 +200,16 @@ class ModelSubclassingTest(test_combinations.TestCase):
         )
         model(tf.ones((32, timesteps, dim)))
 
-    def test_single_io_subclass_build(self):
+    @parameterized.named_parameters(
+        ("int", None, 50),
+        (
+            "dimension",
+            tf.compat.v1.Dimension(None),
+            tf.compat.v1.Dimension(50),
+        ),
+    )
+    def test_single_io_subclass_build(self, batch_size, input_dim):
         num_classes = 2
-        input_dim = 50
-        batch_size = None
-
-        model = test_utils.SmallSubclassMLP(
-            num_hidden=32, num_classes=num_classes, use_dp=True, use_bn=True
-        )
-
-        self.assertFalse(model.built, "Model should not have been built")
-        self.assertFalse(
-            model.weights,
-            ("Model should have no weights since it " "has not been built."),
-        )
-        model.build(input_shape=(batch_size, input_dim))
-        self.assertTrue(
-            model.weights,
-            (
-                "Model should have weights now that it "
-                "has been properly built."
-            ),
-        )
-        self.assertTrue(
-            model.built, "Model should be built after calling `build`."
-        )
-        model(tf.ones((32, input_dim)))
-
-    def test_single_io_dimension_subclass_build(self):
-        num_classes = 2
-        input_dim = tf.compat.v1.Dimension(50)
-        batch_size = tf.compat.v1.Dimension(None)
 
         model = test_utils.SmallSubclassMLP(
             num_hidden=32, num_classes=num_classes, use_dp=True, use_bn=True
@@ -377,10 +354,14 @@ class ModelSubclassingTest(test_combinations.TestCase):
     def test_summary(self):
         class ToString:
             def __init__(self):
-                self.contents = ""
+                self.lines = []
 
             def __call__(self, msg):
-                self.contents += msg + "\n"
+                self.lines.append(msg)
+
+            @property
+            def contents(self):
+                return "\n".join(self.lines) + "\n"
 
         # Single-io
         model = test_utils.SmallSubclassMLP(
@@ -554,8 +535,8 @@ class GraphSpecificModelSubclassingTests(tf.test.TestCase):
             x = tf.ones((num_samples, input_dim))
             y = tf.zeros((num_samples, num_classes))
 
-            model.fit(x, y, epochs=2, steps_per_epoch=10, verbose=0)
-            _ = model.evaluate(steps=10, verbose=0)
+            model.fit(x, y, epochs=2, steps_per_epoch=2, verbose=0)
+            _ = model.evaluate(steps=2, verbose=0)
 
     def test_multi_io_workflow_with_tensors(self):
         num_classes = (2, 3)
@@ -574,9 +555,9 @@ class GraphSpecificModelSubclassingTests(tf.test.TestCase):
             y2 = tf.zeros((num_samples, num_classes[1]))
 
             model.fit(
-                [x1, x2], [y1, y2], epochs=2, steps_per_epoch=10, verbose=0
+                [x1, x2], [y1, y2], epochs=2, steps_per_epoch=2, verbose=0
             )
-            _ = model.evaluate(steps=10, verbose=0)
+            _ = model.evaluate(steps=2, verbose=0)
 
     def test_updates_and_losses_for_nested_models_in_subclassed_model(self):
 
@@ -651,7 +632,7 @@ class GraphSpecificModelSubclassingTests(tf.test.TestCase):
 
     def test_multi_io_workflow_with_numpy_arrays_and_custom_placeholders(self):
         num_classes = (2, 3)
-        num_samples = 1000
+        num_samples = 64
         input_dim = 50
 
         with tf.Graph().as_default(), self.cached_session():
@@ -30,6 +30,15 @@ from tensorflow.python.training.tracking import (
 from tensorflow.python.training.tracking import util
 
 
+class HasWrappedModel(training.Model):
+    def __init__(self, wrapped):
+        super().__init__()
+        self._wrapped = wrapped
+
+    def call(self, x):
+        return self._wrapped(x)
+
+
 class HasList(training.Model):
     def __init__(self):
         super().__init__()
@@ -78,10 +87,8 @@ class ListTests(test_combinations.TestCase):
                 len(model.layers),
                 len(model.layer_list.layers + model.layers_with_updates),
             )
-            for index in range(10):
-                self.assertEqual(
-                    3 + index, model.layer_list.layers[index].units
-                )
+            for index, layer in enumerate(model.layer_list.layers):
+                self.assertEqual(3 + index, layer.units)
             children = model._trackable_children()
             self.assertLen(children, 2)
             self.assertIs(model.layer_list, children["layer_list"])
@@ -122,18 +129,10 @@ class ListTests(test_combinations.TestCase):
         self.assertIn(model.v, model2.trainable_weights)
 
     def testSubSequentialTracking(self):
-        class _Subclassed(training.Model):
-            def __init__(self, wrapped):
-                super().__init__()
-                self._wrapped = wrapped
-
-            def call(self, x):
-                return self._wrapped(x)
-
         model = sequential.Sequential()
         layer = core.Dense(1)
         model.add(layer)
-        model2 = _Subclassed(model)
+        model2 = HasWrappedModel(model)
         model2(tf.ones([1, 2]))
         model2.m = [model]
         self.assertIn(layer.kernel, model2.trainable_weights)
@@ -284,10 +283,9 @@ class MappingTests(test_combinations.TestCase):
             self.assertAllEqual([32, 7], output.shape.as_list())
             self.assertEqual(5, len(model.layers))
             self.assertEqual(len(model.layers), len(model.layer_dict.layers))
-            self.assertLen(model._trackable_children(), 1)
-            self.assertIs(
-                model.layer_dict, model._trackable_children()["layer_dict"]
-            )
+            children = model._trackable_children()
+            self.assertLen(children, 1)
+            self.assertIs(model.layer_dict, children["layer_dict"])
             self.evaluate([v.initializer for v in model.variables])
             test_var = model.layer_dict["output"].kernel
             self.evaluate(test_var.assign(tf.ones([6, 7])))
@@ -446,13 +444,11 @@ class TupleTests(test_combinations.TestCase):
             self.assertEqual(3, model.layer_list.layers[0].units)
             self.assertEqual(4, model.layer_list.layers[1].units)
             self.assertEqual(5, model.layer_list.layers[2].units)
-            self.assertLen(model._trackable_children(), 2)
-            self.assertIs(
-                model.layer_list, model._trackable_children()["layer_list"]
-            )
+            children = model._trackable_children()
+            self.assertLen(children, 2)
+            self.assertIs(model.layer_list, children["layer_list"])
             self.assertIs(
-                model.layers_with_updates,
-                model._trackable_children()["layers_with_updates"],
+                model.layers_with_updates, children["layers_with_updates"]
             )
             self.assertLen(model.layer_list._trackable_children(), 3)
             self.evaluate([v.initializer for v in model.variables])
@@ -492,18 +488,10 @@ class TupleTests(test_combinations.TestCase):
         self.assertIn(model.v, model2.trainable_variables)
 
     def testSubSequentialTracking(self):
-        class _Subclassed(training.Model):
-            def __init__(self, wrapped):
-                super().__init__()
-                self._wrapped = wrapped
-
-            def call(self, x):
-                return self._wrapped(x)
-
         model = sequential.Sequential()
         layer = core.Dense(1)
         model.add(layer)
-        model2 = _Subclassed(model)
+        model2 = HasWrappedModel(model)
         model2(tf.ones([1, 2]))
         model2.m = (model,)
         self.assertIn(layer.kernel, model2.trainable_weights)